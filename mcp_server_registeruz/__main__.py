@@ -5,10 +5,6 @@ import logging
 import os
 import sys
 
-from mcp.server.stdio import stdio_server
-
-from .server import server
-
 # Configure logging
 logging.basicConfig(
     level=os.getenv("LOG_LEVEL", "INFO"),
@@ -23,7 +19,13 @@ async def main():
     """Run the MCP server using stdio transport."""
     logger.info("Starting RegisterUZ MCP Server...")
     logger.info("Transport: stdio (standard input/output)")
-    
+
+    # Deferred so the mcp/httpx/pydantic stack loads after startup
+    # logging, keeping per-session stdio spawn latency low
+    from mcp.server.stdio import stdio_server
+
+    from .server import close_client, server
+
     try:
         async with stdio_server() as (read_stream, write_stream):
             logger.info("Server initialized on stdio transport, ready to handle requests")
@@ -35,12 +37,21 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
-        logger.error(f"Server error: {e}", exc_info=True)
+        logger.error("Server error: %s", e, exc_info=True)
         sys.exit(1)
+    finally:
+        await close_client()
 
 
 def run():
     """Entry point for the script."""
+    try:
+        # libuv-based event loop; a large win for socket-heavy fan-out
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
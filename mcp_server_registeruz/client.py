@@ -1,11 +1,31 @@
 """HTTP client for RegisterUZ API."""
 
-import json
+import asyncio
+import io
 import logging
-from typing import Any, Dict, List, Optional, Union
+import os
+import time
+from array import array
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+import diskcache
 import httpx
+import ijson
+import orjson
 from httpx import HTTPError, Response
+from pydantic import BaseModel, ValidationError
 
 from .config import RegisterUZConfig
 from .types import (
@@ -18,11 +38,52 @@ from .types import (
     FinancialReportDetail,
     FinancialStatementDetail,
     RemainingCountResponse,
+    Template,
     TemplatesResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+_TrustedT = TypeVar("_TrustedT", bound="_TrustedModel")
+
+
+class _TrustedModel(Protocol):
+    """Response models usable with _request's trusted fast path."""
+
+    @classmethod
+    def from_api(cls: "Type[_TrustedT]", data: Dict[str, Any]) -> "_TrustedT": ...
+
+    @classmethod
+    def model_validate_json(
+        cls: "Type[_TrustedT]", json_data: Union[str, bytes]
+    ) -> "_TrustedT": ...
+
+
+def _parse_ids_page(raw: bytes) -> "tuple[array, bool]":
+    """Stream-parse a list-endpoint page into a compact int array.
+
+    Avoids materializing the full response dict and list of boxed ints;
+    IDs land directly in an array('q') buffer (8 bytes per element).
+
+    Args:
+        raw: Raw JSON bytes of a list-endpoint response
+
+    Returns:
+        Tuple of (ids array, existujeDalsieId flag)
+    """
+    ids = array("q")
+    has_more = False
+    try:
+        for prefix, _, value in ijson.parse(io.BytesIO(raw)):
+            if prefix == "id.item":
+                ids.append(value)
+            elif prefix == "existujeDalsieId":
+                has_more = bool(value)
+    except ijson.JSONError as e:
+        raise RegisterUZAPIError(f"Invalid JSON response: {e}")
+    return ids, has_more
+
 
 class RegisterUZError(Exception):
     """Base exception for RegisterUZ API errors."""
@@ -37,9 +98,89 @@ class RegisterUZAPIError(RegisterUZError):
         self.status_code = status_code
 
 
+class _DetailBatcher:
+    """Coalesce detail lookups that arrive close together.
+
+    Requests queued within a small time window are issued as one
+    concurrent fan-out under asyncio.gather, so an MCP client resolving
+    N IDs back-to-back pays min(N, concurrency) round trips instead of N
+    sequential ones.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Awaitable[bytes]],
+        max_batch_size: int = 32,
+        max_queue_time: float = 0.01
+    ) -> None:
+        self._fetch = fetch
+        self._max_batch_size = max_batch_size
+        self._max_queue_time = max_queue_time
+        self._pending: "List[Tuple[int, asyncio.Future[bytes]]]" = []
+        self._flush_task: "Optional[asyncio.Task[None]]" = None
+        # Strong references to in-flight batch tasks; the loop only keeps
+        # weak ones, so an unreferenced task can be collected mid-flight
+        self._batch_tasks: "set[asyncio.Task[None]]" = set()
+
+    async def process(self, item_id: int) -> bytes:
+        """Queue one ID and wait for its batch to resolve."""
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[bytes]" = loop.create_future()
+        self._pending.append((item_id, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_task is None:
+            self._flush_task = loop.create_task(self._delayed_flush())
+
+        return await future
+
+    async def _delayed_flush(self) -> None:
+        """Flush the queue once the batching window elapses."""
+        await asyncio.sleep(self._max_queue_time)
+        self._flush()
+
+    def _flush(self) -> None:
+        """Dispatch all queued lookups as one concurrent batch."""
+        batch, self._pending = self._pending, []
+        task, self._flush_task = self._flush_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        if batch:
+            batch_task = asyncio.get_running_loop().create_task(
+                self._run_batch(batch)
+            )
+            self._batch_tasks.add(batch_task)
+            batch_task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(
+        self, batch: "List[Tuple[int, asyncio.Future[bytes]]]"
+    ) -> None:
+        """Fetch a batch concurrently and resolve the waiting futures."""
+        results = await asyncio.gather(
+            *(self._fetch(item_id) for item_id, _ in batch),
+            return_exceptions=True
+        )
+        for (_, future), result in zip(batch, results):
+            if future.cancelled():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
 class RegisterUZClient:
     """Client for interacting with RegisterUZ API."""
-    
+
+    # List-endpoint path per entity type, resolved once per pagination run
+    _ENTITY_PATHS: Dict[EntityType, str] = {
+        EntityType.UCTOVNE_JEDNOTKY: "/uctovne-jednotky",
+        EntityType.UCTOVNE_ZAVIERKY: "/uctovne-zavierky",
+        EntityType.UCTOVNE_VYKAZY: "/uctovne-vykazy",
+        EntityType.VYROCNE_SPRAVY: "/vyrocne-spravy",
+    }
+
     def __init__(self, config: Optional[RegisterUZConfig] = None):
         """Initialize the RegisterUZ client.
         
@@ -47,38 +188,90 @@ class RegisterUZClient:
             config: Configuration object. If None, will use default config.
         """
         self.config = config or RegisterUZConfig()
-        self.base_url = str(self.config.base_url)
+        self.base_url = self.config.base_url
         
-        # Configure httpx client
-        self.client = httpx.Client(
+        # Configure httpx client (async, with HTTP/2 multiplexing)
+        self.client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=httpx.Timeout(self.config.timeout),
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                max_connections=self.config.max_connections,
+                keepalive_expiry=self.config.keepalive_expiry
+            ),
             headers={
                 "Accept": "application/json",
                 "User-Agent": "RegisterUZ-MCP-Server/0.1.0"
             }
         )
-    
-    def __enter__(self):
-        """Enter context manager."""
+
+        # Pooled client for the suggestion endpoint, which lives under a
+        # different base URL than the public API
+        self._suggestion_client = httpx.AsyncClient(
+            base_url="https://www.registeruz.sk",
+            timeout=httpx.Timeout(self.config.timeout),
+            http2=True,
+            headers={
+                "Accept": "application/json",
+                "User-Agent": "RegisterUZ-MCP-Server/0.1.0"
+            }
+        )
+
+        # On-disk cache for immutable/slowly-changing detail responses
+        self._cache = diskcache.Cache(
+            os.path.expanduser(self.config.cache_dir)
+        )
+
+        # Short-lived in-memory cache of remaining-count probes, so
+        # back-to-back get_all_ids calls don't re-hit the endpoint
+        self._count_cache: Dict[EntityType, "tuple[float, int]"] = {}
+
+        # Per-endpoint batchers that coalesce near-simultaneous detail
+        # lookups into one concurrent fan-out, bounded by a shared semaphore
+        self._detail_semaphore = asyncio.Semaphore(16)
+        self._detail_batchers = {
+            path: _DetailBatcher(self._make_detail_fetch(path))
+            for path in (
+                "/uctovna-jednotka",
+                "/uctovna-zavierka",
+                "/uctovny-vykaz",
+                "/vyrocna-sprava",
+            )
+        }
+
+    def _make_detail_fetch(self, path: str) -> Callable[[int], Awaitable[bytes]]:
+        """Build the semaphore-bounded fetch callable for one detail endpoint."""
+        key_prefix = path.lstrip("/")
+
+        async def fetch(item_id: int) -> bytes:
+            async with self._detail_semaphore:
+                return await self._cached_get(path, {"id": item_id}, key_prefix)
+
+        return fetch
+
+    async def __aenter__(self) -> "RegisterUZClient":
+        """Enter async context manager."""
         return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit async context manager and close client."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients and the response cache."""
+        await self.client.aclose()
+        await self._suggestion_client.aclose()
+        self._cache.close()
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit context manager and close client."""
-        self.close()
-    
-    def close(self):
-        """Close the HTTP client."""
-        self.client.close()
-    
-    def _handle_response(self, response: Response) -> Dict[str, Any]:
+    def _handle_response(self, response: Response) -> bytes:
         """Handle API response and raise exceptions for errors.
         
         Args:
             response: HTTP response from the API
             
         Returns:
-            Parsed JSON response
+            Raw JSON response bytes, ready for model_validate_json
             
         Raises:
             RegisterUZAPIError: If the API returns an error
@@ -86,38 +279,134 @@ class RegisterUZClient:
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error occurred: {e}")
+            logger.error("HTTP error occurred: %s", e)
             raise RegisterUZAPIError(
                 f"API request failed: {e}",
                 status_code=e.response.status_code
             )
         
+        return response.content
+
+    async def _cached_get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        key_prefix: str
+    ) -> bytes:
+        """Fetch raw response bytes through the on-disk cache.
+
+        Args:
+            path: Endpoint path relative to the base URL
+            params: Query parameters (used in the cache key)
+            key_prefix: Endpoint-specific cache key prefix
+
+        Returns:
+            Raw JSON response bytes, either cached or freshly fetched
+        """
+        # Keyed by base URL too: the cache directory is shared, so
+        # repointing REGISTERUZ_BASE_URL must not serve another host's data
+        key = f"{self.base_url}:{key_prefix}:{sorted(params.items()) if params else ''}"
+        cached: Optional[bytes] = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await self.client.get(path, params=params)
+        data = self._handle_response(response)
+        self._cache.set(key, data, expire=self.config.cache_ttl or None)
+        return data
+
+    async def _request(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        model: Type[_TrustedT],
+        what: str,
+        trusted: bool = False
+    ) -> _TrustedT:
+        """Issue a GET request and validate the response into a model.
+
+        Owns error translation for the plain endpoints: HTTP status and
+        transport errors as well as invalid payloads all surface as
+        RegisterUZAPIError.
+
+        Args:
+            path: Endpoint path relative to the base URL
+            params: Query parameters
+            model: Pydantic model to validate the response into
+            what: Human-readable endpoint description for error messages
+            trusted: Skip pydantic validation via the model's from_api
+                constructor; only for flat models fed by the API itself
+        """
         try:
-            return response.json()
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
+            response = await self.client.get(path, params=params)
+            data = self._handle_response(response)
+            if trusted:
+                return model.from_api(orjson.loads(data))
+            return model.model_validate_json(data)
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid JSON response: %s", e)
             raise RegisterUZAPIError(f"Invalid JSON response: {e}")
-    
+        except ValidationError as e:
+            logger.error("Invalid JSON response: %s", e)
+            raise RegisterUZAPIError(f"Invalid JSON response: {e}")
+        except HTTPError as e:
+            logger.error("Failed to get %s: %s", what, e)
+            raise RegisterUZAPIError(f"Failed to get {what}: {e}")
+
+    async def _detail_request(
+        self,
+        path: str,
+        item_id: int,
+        model: Type[_ModelT],
+        what: str
+    ) -> _ModelT:
+        """Resolve a detail lookup through its batcher and validate the bytes.
+
+        With trust_cache enabled, an already-validated object is stored
+        alongside the raw bytes and served on hit without re-running
+        Pydantic validation, which dominates hit-path CPU for the
+        deeply-nested detail models.
+
+        Args:
+            path: Detail endpoint path (selects the batcher)
+            item_id: Record ID to look up
+            model: Pydantic model to validate the response into
+            what: Human-readable endpoint description for error messages
+        """
+        obj_key = f"obj:{self.base_url}:{path}:{item_id}"
+        if self.config.trust_cache:
+            cached: Optional[_ModelT] = self._cache.get(obj_key)
+            if cached is not None:
+                return cached
+
+        try:
+            data = await self._detail_batchers[path].process(item_id)
+            result = model.model_validate_json(data)
+        except ValidationError as e:
+            logger.error("Invalid JSON response: %s", e)
+            raise RegisterUZAPIError(f"Invalid JSON response: {e}")
+        except HTTPError as e:
+            logger.error("Failed to get %s: %s", what, e)
+            raise RegisterUZAPIError(f"Failed to get {what}: {e}")
+
+        if self.config.trust_cache:
+            # diskcache pickles the object, so nested models round-trip
+            # intact; safe because it just passed validation above
+            self._cache.set(obj_key, result, expire=self.config.cache_ttl or None)
+        return result
+
     def _build_params(self, params: BaseSearchParams) -> Dict[str, Any]:
         """Build query parameters from Pydantic model.
-        
+
         Args:
             params: Search parameters
-            
+
         Returns:
             Dictionary of query parameters
         """
-        query_params = {"zmenene-od": params.zmenene_od}
-        
-        if params.pokracovat_za_id is not None:
-            query_params["pokracovat-za-id"] = params.pokracovat_za_id
-        
-        if params.max_zaznamov is not None:
-            query_params["max-zaznamov"] = params.max_zaznamov
-        
-        return query_params
+        return params.to_query()
     
-    def get_accounting_entities(
+    async def get_accounting_entities(
         self,
         params: AccountingEntitySearchParams
     ) -> ApiResponse:
@@ -130,28 +419,13 @@ class RegisterUZClient:
             API response with entity IDs
         """
         query_params = self._build_params(params)
-        
-        # Add entity-specific parameters
-        if params.ico:
-            query_params["ico"] = params.ico
-        if params.dic:
-            query_params["dic"] = params.dic
-        if params.pravna_forma:
-            query_params["pravna-forma"] = (
-                params.pravna_forma.value 
-                if hasattr(params.pravna_forma, 'value') 
-                else params.pravna_forma
-            )
-        
-        try:
-            response = self.client.get("/uctovne-jednotky", params=query_params)
-            data = self._handle_response(response)
-            return ApiResponse(**data)
-        except HTTPError as e:
-            logger.error(f"Failed to get accounting entities: {e}")
-            raise RegisterUZAPIError(f"Failed to get accounting entities: {e}")
+
+        return await self._request(
+            "/uctovne-jednotky", query_params, ApiResponse,
+            "accounting entities", trusted=True
+        )
     
-    def get_financial_statements(
+    async def get_financial_statements(
         self,
         params: BaseSearchParams
     ) -> ApiResponse:
@@ -165,15 +439,12 @@ class RegisterUZClient:
         """
         query_params = self._build_params(params)
         
-        try:
-            response = self.client.get("/uctovne-zavierky", params=query_params)
-            data = self._handle_response(response)
-            return ApiResponse(**data)
-        except HTTPError as e:
-            logger.error(f"Failed to get financial statements: {e}")
-            raise RegisterUZAPIError(f"Failed to get financial statements: {e}")
+        return await self._request(
+            "/uctovne-zavierky", query_params, ApiResponse,
+            "financial statements", trusted=True
+        )
     
-    def get_financial_reports(
+    async def get_financial_reports(
         self,
         params: BaseSearchParams
     ) -> ApiResponse:
@@ -187,15 +458,12 @@ class RegisterUZClient:
         """
         query_params = self._build_params(params)
         
-        try:
-            response = self.client.get("/uctovne-vykazy", params=query_params)
-            data = self._handle_response(response)
-            return ApiResponse(**data)
-        except HTTPError as e:
-            logger.error(f"Failed to get financial reports: {e}")
-            raise RegisterUZAPIError(f"Failed to get financial reports: {e}")
+        return await self._request(
+            "/uctovne-vykazy", query_params, ApiResponse,
+            "financial reports", trusted=True
+        )
     
-    def get_annual_reports(
+    async def get_annual_reports(
         self,
         params: BaseSearchParams
     ) -> ApiResponse:
@@ -209,15 +477,12 @@ class RegisterUZClient:
         """
         query_params = self._build_params(params)
         
-        try:
-            response = self.client.get("/vyrocne-spravy", params=query_params)
-            data = self._handle_response(response)
-            return ApiResponse(**data)
-        except HTTPError as e:
-            logger.error(f"Failed to get annual reports: {e}")
-            raise RegisterUZAPIError(f"Failed to get annual reports: {e}")
+        return await self._request(
+            "/vyrocne-spravy", query_params, ApiResponse,
+            "annual reports", trusted=True
+        )
     
-    def get_remaining_count(
+    async def get_remaining_count(
         self,
         entity_type: EntityType
     ) -> RemainingCountResponse:
@@ -229,29 +494,74 @@ class RegisterUZClient:
         Returns:
             Response with remaining count
         """
-        try:
-            response = self.client.get(f"/zostavajuce-id/{entity_type.value}")
-            data = self._handle_response(response)
-            return RemainingCountResponse(**data)
-        except HTTPError as e:
-            logger.error(f"Failed to get remaining count: {e}")
-            raise RegisterUZAPIError(f"Failed to get remaining count: {e}")
+        return await self._request(
+            f"/zostavajuce-id/{entity_type.value}",
+            None,
+            RemainingCountResponse,
+            "remaining count",
+            trusted=True
+        )
     
-    def get_templates(self) -> TemplatesResponse:
+    async def get_templates(self) -> TemplatesResponse:
         """Get all report templates.
         
         Returns:
             Response with template list
         """
         try:
-            response = self.client.get("/sablony")
-            data = self._handle_response(response)
-            return TemplatesResponse(**data)
+            data = await self._cached_get("/sablony", None, "sablony")
+            # Trusted-source fast path: template payloads come straight
+            # from the registry and tabulky can hold thousands of rows,
+            # so skip walking them through field validation
+            parsed = orjson.loads(data)
+            return TemplatesResponse.model_construct(
+                sablony=[
+                    Template.model_construct(
+                        id=t.get("id"),
+                        nazov=t.get("nazov"),
+                        tabulky=t.get("tabulky"),
+                        nariadenie_mf=t.get("nariadenieMF"),
+                    )
+                    for t in parsed.get("sablony") or []
+                ]
+            )
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid JSON response: %s", e)
+            raise RegisterUZAPIError(f"Invalid JSON response: {e}")
         except HTTPError as e:
-            logger.error(f"Failed to get templates: {e}")
+            logger.error("Failed to get templates: %s", e)
             raise RegisterUZAPIError(f"Failed to get templates: {e}")
     
-    def get_all_ids(
+    _COUNT_CACHE_TTL = 60.0
+
+    async def _remaining_count_hint(self, entity_type: EntityType) -> int:
+        """Get the remaining-ID count as a preallocation hint.
+
+        Results are cached in memory for ~60s; a failed probe returns 0
+        rather than failing the caller, since the count is only a hint.
+
+        Args:
+            entity_type: Type of entity
+
+        Returns:
+            Remaining count, or 0 if the probe failed
+        """
+        cached = self._count_cache.get(entity_type)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._COUNT_CACHE_TTL:
+            return cached[1]
+
+        try:
+            count = (await self.get_remaining_count(entity_type)).pocet
+        except (RegisterUZError, AttributeError):
+            # AttributeError: trusted decode skips required-field checks,
+            # so a payload without "pocet" surfaces here instead
+            return 0
+
+        self._count_cache[entity_type] = (now, count)
+        return count
+
+    async def get_all_ids(
         self,
         entity_type: EntityType,
         from_date: Optional[str] = None,
@@ -268,51 +578,128 @@ class RegisterUZClient:
             List of all entity IDs
         """
         from_date = from_date or self.config.default_from_date
-        all_ids: List[int] = []
         continue_after_id: Optional[int] = None
         
-        while True:
-            # Prepare parameters based on entity type
-            if entity_type == EntityType.UCTOVNE_JEDNOTKY:
-                params = AccountingEntitySearchParams(
-                    zmenene_od=from_date,
-                    pokracovat_za_id=continue_after_id,
-                    max_zaznamov=self.config.max_records
-                )
-                response = self.get_accounting_entities(params)
-            else:
-                params = BaseSearchParams(
-                    zmenene_od=from_date,
-                    pokracovat_za_id=continue_after_id,
-                    max_zaznamov=self.config.max_records
-                )
-                
-                if entity_type == EntityType.UCTOVNE_ZAVIERKY:
-                    response = self.get_financial_statements(params)
-                elif entity_type == EntityType.UCTOVNE_VYKAZY:
-                    response = self.get_financial_reports(params)
-                elif entity_type == EntityType.VYROCNE_SPRAVY:
-                    response = self.get_annual_reports(params)
-                else:
-                    raise ValueError(f"Unknown entity type: {entity_type}")
-            
-            all_ids.extend(response.id)
-            
-            # Check if we've reached the limit
-            if max_total and len(all_ids) >= max_total:
-                all_ids = all_ids[:max_total]
-                break
-            
-            # Check if there are more records
-            if not response.existujeDalsieId or not response.id:
-                break
-            
-            # Set up for next iteration
-            continue_after_id = response.id[-1]
+        path = self._ENTITY_PATHS[entity_type]
         
-        return all_ids
+        # Preallocate the buffer from the (cached) remaining-count probe
+        # so multi-page fetches fill by index instead of reallocating
+        total_hint = await self._remaining_count_hint(entity_type)
+        if max_total is not None:
+            total_hint = min(total_hint, max_total)
+        all_ids = array("q", bytes(8 * total_hint))
+        idx = 0
+        next_task: "Optional[asyncio.Task]" = None
+
+        try:
+            while True:
+                # Never request more than still needed; shrinks the final page
+                page_size = self.config.max_records
+                if max_total is not None:
+                    page_size = min(page_size, max_total - idx)
+
+                try:
+                    if next_task is not None:
+                        response = await next_task
+                        next_task = None
+                    else:
+                        params = BaseSearchParams(
+                            zmenene_od=from_date,
+                            pokracovat_za_id=continue_after_id,
+                            max_zaznamov=page_size
+                        )
+                        response = await self.client.get(
+                            path, params=self._build_params(params)
+                        )
+                    raw = self._handle_response(response)
+                except HTTPError as e:
+                    logger.error("Failed to get %s: %s", entity_type.value, e)
+                    raise RegisterUZAPIError(
+                        f"Failed to get {entity_type.value}: {e}"
+                    )
+
+                # Speculatively start fetching the next page before parsing
+                # this one: the cursor is just the last "id" element, which
+                # a single orjson pass recovers cheaply, so the network wait
+                # for page N+1 overlaps the CPU parse of page N. Skipped
+                # when max_total is set, since the next page size depends on
+                # how many IDs this page will yield.
+                if max_total is None:
+                    try:
+                        peek = orjson.loads(raw)
+                        peek_ids = peek.get("id")
+                        if peek.get("existujeDalsieId") and peek_ids:
+                            next_params = BaseSearchParams(
+                                zmenene_od=from_date,
+                                pokracovat_za_id=peek_ids[-1],
+                                max_zaznamov=self.config.max_records
+                            )
+                            next_task = asyncio.create_task(
+                                self.client.get(
+                                    path,
+                                    params=self._build_params(next_params)
+                                )
+                            )
+                    except orjson.JSONDecodeError:
+                        # _parse_ids_page below raises the canonical error
+                        pass
+
+                # Stream-parse straight into the compact buffer; slice
+                # assignment is a C-level memory copy that extends past the
+                # preallocated size if the hint undershot
+                ids, has_more = _parse_ids_page(raw)
+                all_ids[idx:idx + len(ids)] = ids
+                idx += len(ids)
+
+                # Check if we've reached the limit
+                if max_total is not None and idx >= max_total:
+                    idx = max_total
+                    break
+
+                # Check if there are more records
+                if not has_more or not ids:
+                    break
+
+                # Set up for next iteration
+                continue_after_id = ids[-1]
+        finally:
+            # Drop any speculative fetch left in flight when the loop exits
+            if next_task is not None:
+                next_task.cancel()
+
+        # Trim unfilled preallocation (or overshoot) in place
+        del all_ids[idx:]
+        return all_ids.tolist()
     
-    def get_entity_suggestions(self, query: str) -> List[str]:
+    async def get_all_ids_multi(
+        self,
+        entity_types: List[EntityType],
+        from_date: Optional[str] = None,
+        max_total: Optional[int] = None
+    ) -> Dict[EntityType, List[int]]:
+        """Get all IDs for several entity types concurrently.
+
+        Each entity type runs its own pagination loop; the loops are
+        overlapped with asyncio.gather so network latency is shared
+        across types instead of paid sequentially.
+
+        Args:
+            entity_types: Entity types to fetch
+            from_date: Date from which to retrieve changed records
+            max_total: Maximum total records to retrieve per type (None for all)
+
+        Returns:
+            Mapping of entity type to its list of IDs
+        """
+        results = await asyncio.gather(
+            *(
+                self.get_all_ids(entity_type, from_date, max_total)
+                for entity_type in entity_types
+            )
+        )
+        return dict(zip(entity_types, results))
+
+    async def get_entity_suggestions(self, query: str) -> List[str]:
         """Get entity name suggestions based on a search query.
         
         Args:
@@ -322,22 +709,15 @@ class RegisterUZClient:
             List of entity name suggestions
         """
         try:
-            # Use a different base URL for the suggestion endpoint
-            suggestion_url = "https://www.registeruz.sk/cruz-public/domain/suggestion/search"
-            
-            # Create a separate request since this uses a different base URL
-            response = httpx.get(
-                suggestion_url,
-                params={"query": query},
-                timeout=httpx.Timeout(self.config.timeout),
-                headers={
-                    "Accept": "application/json",
-                    "User-Agent": "RegisterUZ-MCP-Server/0.1.0"
-                }
+            response = await self._suggestion_client.get(
+                "/cruz-public/domain/suggestion/search",
+                params={"query": query}
             )
             
             response.raise_for_status()
-            data = response.json()
+            # The payload is a bare list/dict, not a model; orjson parses
+            # the raw bytes without an intermediate unicode decode
+            data = orjson.loads(response.content)
             
             # Extract suggestions from the response
             # The API might return a list of objects with suggestion text
@@ -351,16 +731,16 @@ class RegisterUZClient:
                 return [str(data)]
                 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error occurred: {e}")
+            logger.error("HTTP error occurred: %s", e)
             raise RegisterUZAPIError(
                 f"Failed to get entity suggestions: {e}",
                 status_code=e.response.status_code
             )
         except Exception as e:
-            logger.error(f"Failed to get entity suggestions: {e}")
+            logger.error("Failed to get entity suggestions: %s", e)
             raise RegisterUZAPIError(f"Failed to get entity suggestions: {e}")
     
-    def get_accounting_entity_detail(self, entity_id: int) -> AccountingEntityDetail:
+    async def get_accounting_entity_detail(self, entity_id: int) -> AccountingEntityDetail:
         """Get detailed information about an accounting entity.
         
         Args:
@@ -369,18 +749,11 @@ class RegisterUZClient:
         Returns:
             Detailed entity information
         """
-        try:
-            response = self.client.get(
-                "/uctovna-jednotka",
-                params={"id": entity_id}
-            )
-            data = self._handle_response(response)
-            return AccountingEntityDetail(**data)
-        except HTTPError as e:
-            logger.error(f"Failed to get accounting entity detail: {e}")
-            raise RegisterUZAPIError(f"Failed to get accounting entity detail: {e}")
+        return await self._detail_request(
+            "/uctovna-jednotka", entity_id, AccountingEntityDetail, "accounting entity detail"
+        )
     
-    def get_financial_statement_detail(self, statement_id: int) -> FinancialStatementDetail:
+    async def get_financial_statement_detail(self, statement_id: int) -> FinancialStatementDetail:
         """Get detailed information about a financial statement.
         
         Args:
@@ -389,18 +762,11 @@ class RegisterUZClient:
         Returns:
             Detailed statement information
         """
-        try:
-            response = self.client.get(
-                "/uctovna-zavierka",
-                params={"id": statement_id}
-            )
-            data = self._handle_response(response)
-            return FinancialStatementDetail(**data)
-        except HTTPError as e:
-            logger.error(f"Failed to get financial statement detail: {e}")
-            raise RegisterUZAPIError(f"Failed to get financial statement detail: {e}")
+        return await self._detail_request(
+            "/uctovna-zavierka", statement_id, FinancialStatementDetail, "financial statement detail"
+        )
     
-    def get_financial_report_detail(self, report_id: int) -> FinancialReportDetail:
+    async def get_financial_report_detail(self, report_id: int) -> FinancialReportDetail:
         """Get detailed information about a financial report.
         
         Args:
@@ -409,18 +775,11 @@ class RegisterUZClient:
         Returns:
             Detailed report information including content
         """
-        try:
-            response = self.client.get(
-                "/uctovny-vykaz",
-                params={"id": report_id}
-            )
-            data = self._handle_response(response)
-            return FinancialReportDetail(**data)
-        except HTTPError as e:
-            logger.error(f"Failed to get financial report detail: {e}")
-            raise RegisterUZAPIError(f"Failed to get financial report detail: {e}")
+        return await self._detail_request(
+            "/uctovny-vykaz", report_id, FinancialReportDetail, "financial report detail"
+        )
     
-    def get_annual_report_detail(self, report_id: int) -> AnnualReportDetail:
+    async def get_annual_report_detail(self, report_id: int) -> AnnualReportDetail:
         """Get detailed information about an annual report.
         
         Args:
@@ -429,13 +788,6 @@ class RegisterUZClient:
         Returns:
             Detailed annual report information
         """
-        try:
-            response = self.client.get(
-                "/vyrocna-sprava",
-                params={"id": report_id}
-            )
-            data = self._handle_response(response)
-            return AnnualReportDetail(**data)
-        except HTTPError as e:
-            logger.error(f"Failed to get annual report detail: {e}")
-            raise RegisterUZAPIError(f"Failed to get annual report detail: {e}")
\ No newline at end of file
+        return await self._detail_request(
+            "/vyrocna-sprava", report_id, AnnualReportDetail, "annual report detail"
+        )
\ No newline at end of file
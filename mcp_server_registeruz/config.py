@@ -1,19 +1,21 @@
 """Configuration module for RegisterUZ MCP Server."""
 
+import functools
 import os
+import re
+from datetime import date
 from typing import Optional
 
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, Field, field_validator
 
-# Load environment variables from .env file
-load_dotenv()
+# Compiled once at import; validators run per config instantiation
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
 class RegisterUZConfig(BaseModel):
     """Configuration for RegisterUZ API client."""
     
-    base_url: HttpUrl = Field(
+    base_url: str = Field(
         default="https://www.registeruz.sk/cruz-public/api",
         description="Base URL for RegisterUZ API"
     )
@@ -33,25 +35,50 @@ class RegisterUZConfig(BaseModel):
         default="2000-01-01",
         description="Default date for initial data fetch (YYYY-MM-DD)"
     )
+    max_keepalive_connections: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum number of keep-alive connections in the pool"
+    )
+    max_connections: int = Field(
+        default=128,
+        ge=1,
+        description="Maximum number of concurrent connections"
+    )
+    keepalive_expiry: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds an idle keep-alive connection stays open"
+    )
+    cache_dir: str = Field(
+        default="~/.cache/registeruz",
+        description="Directory for the on-disk response cache"
+    )
+    cache_ttl: int = Field(
+        default=86400,
+        ge=0,
+        description="Cache entry lifetime in seconds (0 disables expiry)"
+    )
+    trust_cache: bool = Field(
+        default=False,
+        description="Serve cached detail objects without re-validation"
+    )
     
     @field_validator("default_from_date")
     @classmethod
     def validate_date_format(cls, v: str) -> str:
         """Validate date format is YYYY-MM-DD."""
-        import re
-        pattern = r"^\d{4}-\d{2}-\d{2}$"
-        if not re.match(pattern, v):
+        if not _DATE_RE.match(v):
             raise ValueError("Date must be in YYYY-MM-DD format")
+        # fromisoformat is implemented in C and also rejects invalid calendar dates
+        date.fromisoformat(v)
         return v
     
     @field_validator("base_url")
     @classmethod
-    def ensure_base_url_format(cls, v: HttpUrl) -> HttpUrl:
+    def ensure_base_url_format(cls, v: str) -> str:
         """Ensure base URL doesn't end with slash."""
-        url_str = str(v)
-        if url_str.endswith("/"):
-            url_str = url_str.rstrip("/")
-        return HttpUrl(url_str)
+        return v.rstrip("/")
     
     class Config:
         """Pydantic config."""
@@ -59,11 +86,25 @@ class RegisterUZConfig(BaseModel):
         str_strip_whitespace = True
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> RegisterUZConfig:
-    """Get configuration from environment variables."""
+    """Get configuration from environment variables.
+
+    The result is memoized: the environment is read (and .env loaded)
+    once per process.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
     return RegisterUZConfig(
         base_url=os.getenv("REGISTERUZ_BASE_URL", "https://www.registeruz.sk/cruz-public/api"),
         timeout=int(os.getenv("REGISTERUZ_TIMEOUT", "30")),
         max_records=int(os.getenv("REGISTERUZ_MAX_RECORDS", "1000")),
-        default_from_date=os.getenv("REGISTERUZ_DEFAULT_FROM_DATE", "2000-01-01")
+        default_from_date=os.getenv("REGISTERUZ_DEFAULT_FROM_DATE", "2000-01-01"),
+        max_keepalive_connections=int(os.getenv("REGISTERUZ_MAX_KEEPALIVE_CONNECTIONS", "64")),
+        max_connections=int(os.getenv("REGISTERUZ_MAX_CONNECTIONS", "128")),
+        keepalive_expiry=float(os.getenv("REGISTERUZ_KEEPALIVE_EXPIRY", "60.0")),
+        cache_dir=os.getenv("REGISTERUZ_CACHE_DIR", "~/.cache/registeruz"),
+        cache_ttl=int(os.getenv("REGISTERUZ_CACHE_TTL", "86400")),
+        trust_cache=os.getenv("REGISTERUZ_TRUST_CACHE", "").lower() in ("1", "true", "yes")
     )
\ No newline at end of file
@@ -1,25 +1,20 @@
 """MCP Server for RegisterUZ API."""
 
 import asyncio
-import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type
 
+import orjson
 from mcp import types
 from mcp.server import Server
 from pydantic import ValidationError
 
-from .client import RegisterUZClient, RegisterUZError
-from .config import get_config
+from .client import RegisterUZAPIError, RegisterUZClient, RegisterUZError
+from .config import _DATE_RE, get_config
 from .types import (
-    AccountingEntityDetail,
     AccountingEntitySearchParams,
-    AnnualReportDetail,
     BaseSearchParams,
     EntityType,
-    FinancialReportDetail,
-    FinancialStatementDetail,
-    LegalForm,
 )
 
 logger = logging.getLogger(__name__)
@@ -27,462 +22,569 @@ logger = logging.getLogger(__name__)
 # Initialize the MCP server
 server = Server("registeruz-mcp-server")
 
+# One long-lived client for the whole server process: connection pool,
+# TLS sessions and caches are amortized across tool calls instead of
+# being rebuilt per invocation
+_client: Optional[RegisterUZClient] = None
+_client_lock = asyncio.Lock()
+
+
+async def _get_client() -> RegisterUZClient:
+    """Get the shared client, creating it on first use."""
+    global _client
+    if _client is None:
+        async with _client_lock:
+            if _client is None:
+                _client = RegisterUZClient(get_config())
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client, releasing pool and cache resources."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 def format_success_response(data: Any) -> List[types.TextContent]:
     """Format successful response data."""
+    # orjson serializes in one C pass straight to UTF-8 bytes; large ID
+    # lists and report dicts make tool responses serialization-bound
     return [types.TextContent(
         type="text",
-        text=json.dumps(data, indent=2, default=str, ensure_ascii=False)
+        text=orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
     )]
 
 
-def format_error_response(error: Exception) -> List[types.TextContent]:
-    """Format error response."""
-    error_message = f"Error: {type(error).__name__}: {str(error)}"
-    logger.error(error_message)
+def format_model(model: Any) -> List[types.TextContent]:
+    """Format a Pydantic model as response content.
+
+    model_dump_json serializes in one pydantic-core pass, skipping the
+    intermediate dict that .dict() + a second JSON walk would build.
+    """
+    return [types.TextContent(
+        type="text",
+        text=model.model_dump_json(exclude_none=True, by_alias=True, indent=2)
+    )]
+
+
+def format_error_response(
+    error: Exception, log: bool = True
+) -> List[types.TextContent]:
+    """Format error response.
+
+    Pass log=False when the call site has already logged the failure
+    (e.g. with a traceback) to avoid building the record twice.
+    """
+    error_message = "".join(("Error: ", type(error).__name__, ": ", str(error)))
+    if isinstance(error, RegisterUZAPIError) and error.status_code is not None:
+        # Surface the upstream status without another format pass
+        error_message = "".join(
+            (error_message, " (status ", str(error.status_code), ")")
+        )
+    if log:
+        logger.error(error_message)
     return [types.TextContent(type="text", text=error_message)]
 
 
-@server.list_tools()
-async def list_tools() -> List[types.Tool]:
-    """List available tools."""
-    return [
-        types.Tool(
-            name="search_accounting_entities",
-            description="Search for accounting entities (companies) in Slovak business register",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "changed_from": {
-                        "type": "string",
-                        "description": "Date from which to retrieve changed records (YYYY-MM-DD)",
-                        "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                    },
-                    "ico": {
-                        "type": "string",
-                        "description": "Company identification number (IČO)"
-                    },
-                    "dic": {
-                        "type": "string",
-                        "description": "Tax identification number (DIČ)"
-                    },
-                    "legal_form": {
-                        "type": "string",
-                        "description": "Legal form code (e.g., '112' for s.r.o., '121' for a.s.)",
-                        "enum": ["112", "121", "113", "111", "301", "221"]
-                    },
-                    "continue_after_id": {
-                        "type": "integer",
-                        "description": "Continue pagination after this ID"
-                    },
-                    "max_records": {
-                        "type": "integer",
-                        "description": "Maximum records to return (1-10000)",
-                        "minimum": 1,
-                        "maximum": 10000
-                    }
+# Fixed prefix for the unknown-tool reply, so rejecting a bad tool name
+# never constructs or stringifies an exception
+_UNKNOWN_TOOL_PREFIX = "Error: ValueError: Unknown tool: "
+
+# Direct value->member lookup, skipping the Enum __call__ machinery
+_ENTITY_TYPE_MAP: Dict[str, EntityType] = {et.value: et for et in EntityType}
+
+def _format_id_list_response(ids: List[int], has_more: bool) -> str:
+    """Render the fixed {ids, has_more, count} shape without a JSON encoder.
+
+    The shape is fully known and the values are plain ints and a bool,
+    so one C-level join over the IDs beats generic encoder dispatch.
+    """
+    return (
+        '{\n  "ids": [' + ",".join(map(str, ids)) + '],\n  "has_more": '
+        + ("true" if has_more else "false")
+        + ',\n  "count": ' + str(len(ids)) + "\n}"
+    )
+
+
+# Tool schemas are static; build the list once at import instead of
+# re-allocating every Tool object per list_tools request
+_TOOLS: List[types.Tool] = [
+    types.Tool(
+        name="search_accounting_entities",
+        description="Search for accounting entities (companies) in Slovak business register",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "changed_from": {
+                    "type": "string",
+                    "description": "Date from which to retrieve changed records (YYYY-MM-DD)",
+                    "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
                 },
-                "required": ["changed_from"]
-            }
-        ),
-        types.Tool(
-            name="get_financial_statements",
-            description="Get financial statement identifiers from Slovak business register",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "changed_from": {
-                        "type": "string",
-                        "description": "Date from which to retrieve changed records (YYYY-MM-DD)",
-                        "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                    },
-                    "continue_after_id": {
-                        "type": "integer",
-                        "description": "Continue pagination after this ID"
-                    },
-                    "max_records": {
-                        "type": "integer",
-                        "description": "Maximum records to return (1-10000)",
-                        "minimum": 1,
-                        "maximum": 10000
-                    }
+                "ico": {
+                    "type": "string",
+                    "description": "Company identification number (IČO)"
                 },
-                "required": ["changed_from"]
-            }
-        ),
-        types.Tool(
-            name="get_financial_reports",
-            description="Get financial report identifiers from Slovak business register",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "changed_from": {
-                        "type": "string",
-                        "description": "Date from which to retrieve changed records (YYYY-MM-DD)",
-                        "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                    },
-                    "continue_after_id": {
-                        "type": "integer",
-                        "description": "Continue pagination after this ID"
-                    },
-                    "max_records": {
-                        "type": "integer",
-                        "description": "Maximum records to return (1-10000)",
-                        "minimum": 1,
-                        "maximum": 10000
-                    }
+                "dic": {
+                    "type": "string",
+                    "description": "Tax identification number (DIČ)"
                 },
-                "required": ["changed_from"]
-            }
-        ),
-        types.Tool(
-            name="get_annual_reports",
-            description="Get annual report identifiers from Slovak business register",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "changed_from": {
-                        "type": "string",
-                        "description": "Date from which to retrieve changed records (YYYY-MM-DD)",
-                        "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                    },
-                    "continue_after_id": {
-                        "type": "integer",
-                        "description": "Continue pagination after this ID"
-                    },
-                    "max_records": {
-                        "type": "integer",
-                        "description": "Maximum records to return (1-10000)",
-                        "minimum": 1,
-                        "maximum": 10000
-                    }
+                "legal_form": {
+                    "type": "string",
+                    "description": "Legal form code (e.g., '112' for s.r.o., '121' for a.s.)",
+                    "enum": ["112", "121", "113", "111", "301", "221"]
                 },
-                "required": ["changed_from"]
-            }
-        ),
-        types.Tool(
-            name="get_templates",
-            description="Get all available report templates from Slovak business register",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        types.Tool(
-            name="get_remaining_count",
-            description="Get count of remaining IDs for a specific entity type",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Type of entity",
-                        "enum": ["uctovne-jednotky", "uctovne-zavierky", "uctovne-vykazy", "vyrocne-spravy"]
-                    }
+                "continue_after_id": {
+                    "type": "integer",
+                    "description": "Continue pagination after this ID"
                 },
-                "required": ["entity_type"]
-            }
-        ),
-        types.Tool(
-            name="get_all_entity_ids",
-            description="Get all IDs for an entity type with automatic pagination (use carefully for large datasets)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entity_type": {
-                        "type": "string",
-                        "description": "Type of entity",
-                        "enum": ["uctovne-jednotky", "uctovne-zavierky", "uctovne-vykazy", "vyrocne-spravy"]
-                    },
-                    "changed_from": {
-                        "type": "string",
-                        "description": "Date from which to retrieve changed records (YYYY-MM-DD)",
-                        "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                    },
-                    "max_total": {
-                        "type": "integer",
-                        "description": "Maximum total records to retrieve",
-                        "minimum": 1
-                    }
+                "max_records": {
+                    "type": "integer",
+                    "description": "Maximum records to return (1-10000)",
+                    "minimum": 1,
+                    "maximum": 10000
+                }
+            },
+            "required": ["changed_from"]
+        }
+    ),
+    types.Tool(
+        name="get_financial_statements",
+        description="Get financial statement identifiers from Slovak business register",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "changed_from": {
+                    "type": "string",
+                    "description": "Date from which to retrieve changed records (YYYY-MM-DD)",
+                    "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
                 },
-                "required": ["entity_type"]
-            }
-        ),
-        types.Tool(
-            name="get_entity_suggestions",
-            description="Get entity name suggestions based on a search query",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "The search term to get suggestions for (partial entity name)",
-                        "minLength": 1
-                    }
+                "continue_after_id": {
+                    "type": "integer",
+                    "description": "Continue pagination after this ID"
                 },
-                "required": ["query"]
-            }
-        ),
-        types.Tool(
-            name="get_accounting_entity_detail",
-            description="Get detailed information about a specific accounting entity (company)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "integer",
-                        "description": "The accounting entity ID (max 10 digits)"
-                    }
+                "max_records": {
+                    "type": "integer",
+                    "description": "Maximum records to return (1-10000)",
+                    "minimum": 1,
+                    "maximum": 10000
+                }
+            },
+            "required": ["changed_from"]
+        }
+    ),
+    types.Tool(
+        name="get_financial_reports",
+        description="Get financial report identifiers from Slovak business register",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "changed_from": {
+                    "type": "string",
+                    "description": "Date from which to retrieve changed records (YYYY-MM-DD)",
+                    "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
                 },
-                "required": ["id"]
-            }
-        ),
-        types.Tool(
-            name="get_financial_statement_detail",
-            description="Get detailed information about a specific financial statement",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "integer",
-                        "description": "The financial statement ID (max 10 digits)"
-                    }
+                "continue_after_id": {
+                    "type": "integer",
+                    "description": "Continue pagination after this ID"
                 },
-                "required": ["id"]
-            }
-        ),
-        types.Tool(
-            name="get_financial_report_detail",
-            description="Get detailed information about a specific financial report with data content",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "integer",
-                        "description": "The financial report ID (max 10 digits)"
-                    }
+                "max_records": {
+                    "type": "integer",
+                    "description": "Maximum records to return (1-10000)",
+                    "minimum": 1,
+                    "maximum": 10000
+                }
+            },
+            "required": ["changed_from"]
+        }
+    ),
+    types.Tool(
+        name="get_annual_reports",
+        description="Get annual report identifiers from Slovak business register",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "changed_from": {
+                    "type": "string",
+                    "description": "Date from which to retrieve changed records (YYYY-MM-DD)",
+                    "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
                 },
-                "required": ["id"]
-            }
-        ),
-        types.Tool(
-            name="get_annual_report_detail",
-            description="Get detailed information about a specific annual report",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "id": {
-                        "type": "integer",
-                        "description": "The annual report ID (max 10 digits)"
-                    }
+                "continue_after_id": {
+                    "type": "integer",
+                    "description": "Continue pagination after this ID"
                 },
-                "required": ["id"]
-            }
-        )
+                "max_records": {
+                    "type": "integer",
+                    "description": "Maximum records to return (1-10000)",
+                    "minimum": 1,
+                    "maximum": 10000
+                }
+            },
+            "required": ["changed_from"]
+        }
+    ),
+    types.Tool(
+        name="get_templates",
+        description="Get all available report templates from Slovak business register",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    types.Tool(
+        name="get_remaining_count",
+        description="Get count of remaining IDs for a specific entity type",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_type": {
+                    "type": "string",
+                    "description": "Type of entity",
+                    "enum": ["uctovne-jednotky", "uctovne-zavierky", "uctovne-vykazy", "vyrocne-spravy"]
+                }
+            },
+            "required": ["entity_type"]
+        }
+    ),
+    types.Tool(
+        name="get_all_entity_ids",
+        description="Get all IDs for an entity type with automatic pagination (use carefully for large datasets)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entity_type": {
+                    "type": "string",
+                    "description": "Type of entity",
+                    "enum": ["uctovne-jednotky", "uctovne-zavierky", "uctovne-vykazy", "vyrocne-spravy"]
+                },
+                "changed_from": {
+                    "type": "string",
+                    "description": "Date from which to retrieve changed records (YYYY-MM-DD)",
+                    "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
+                },
+                "max_total": {
+                    "type": "integer",
+                    "description": "Maximum total records to retrieve",
+                    "minimum": 1
+                }
+            },
+            "required": ["entity_type"]
+        }
+    ),
+    types.Tool(
+        name="get_entity_suggestions",
+        description="Get entity name suggestions based on a search query",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The search term to get suggestions for (partial entity name)",
+                    "minLength": 1
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    types.Tool(
+        name="get_accounting_entity_detail",
+        description="Get detailed information about a specific accounting entity (company)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": "integer",
+                    "description": "The accounting entity ID (max 10 digits)"
+                }
+            },
+            "required": ["id"]
+        }
+    ),
+    types.Tool(
+        name="get_financial_statement_detail",
+        description="Get detailed information about a specific financial statement",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": "integer",
+                    "description": "The financial statement ID (max 10 digits)"
+                }
+            },
+            "required": ["id"]
+        }
+    ),
+    types.Tool(
+        name="get_financial_report_detail",
+        description="Get detailed information about a specific financial report with data content",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": "integer",
+                    "description": "The financial report ID (max 10 digits)"
+                }
+            },
+            "required": ["id"]
+        }
+    ),
+    types.Tool(
+        name="get_annual_report_detail",
+        description="Get detailed information about a specific annual report",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": "integer",
+                    "description": "The annual report ID (max 10 digits)"
+                }
+            },
+            "required": ["id"]
+        }
+    )
+]
+
+
+@server.list_tools()
+async def list_tools() -> List[types.Tool]:
+    """List available tools."""
+    return _TOOLS
+
+
+# Signature shared by every tool handler in _HANDLERS
+_Handler = Callable[
+    [RegisterUZClient, Dict[str, Any]], Awaitable[List[types.TextContent]]
+]
+
+
+def _make_list_handler(
+    params_cls: Type[BaseSearchParams],
+    method_name: str,
+    extra_fields: Optional[Dict[str, str]] = None
+) -> _Handler:
+    """Build a handler for the paginated ID-listing endpoints.
+
+    All four listing tools build a search-params model, call one client
+    method and return the same {ids, has_more, count} shape; they differ
+    only in the params class, the method and any entity-specific filter
+    fields (mapped here as model field -> tool argument).
+    """
+    async def handler(
+        client: RegisterUZClient, arguments: Dict[str, Any]
+    ) -> List[types.TextContent]:
+        # Reject malformed dates up front rather than spending a
+        # network round trip on input the API will refuse anyway
+        if not _DATE_RE.match(arguments["changed_from"]):
+            return format_error_response(
+                ValueError("changed_from must be YYYY-MM-DD")
+            )
+
+        kwargs: Dict[str, Any] = {
+            "zmenene_od": arguments["changed_from"],
+            "pokracovat_za_id": arguments.get("continue_after_id"),
+            "max_zaznamov": arguments.get("max_records"),
+        }
+        if extra_fields:
+            for field, arg in extra_fields.items():
+                kwargs[field] = arguments.get(arg)
+
+        # With the fastjsonschema extra installed, the tool inputSchema
+        # already enforced pattern/range/enum, so pydantic's second pass
+        # over the same values is redundant; on a bare install fall back
+        # to validated construction so range checks still apply
+        if _VALIDATORS:
+            params = params_cls.model_construct(**kwargs)
+        else:
+            params = params_cls(**kwargs)
+        result = await getattr(client, method_name)(params)
+
+        return [types.TextContent(
+            type="text",
+            text=_format_id_list_response(result.id, result.existuje_dalsie_id)
+        )]
+
+    return handler
+
+
+async def _handle_get_templates(
+    client: RegisterUZClient, arguments: Dict[str, Any]
+) -> List[types.TextContent]:
+    result = await client.get_templates()
+
+    # Summarize templates for readability; built as a comprehension so
+    # the per-item work stays in tight bytecode for large template sets
+    templates_data = [
+        {k: v for k, v in (
+            ("id", t.id),
+            ("name", t.nazov),
+            ("regulation", t.nariadenie_mf),
+            ("tables_count", len(t.tabulky) if t.tabulky else None),
+        ) if v is not None}
+        for t in result.sablony
     ]
 
+    return format_success_response({
+        "templates": templates_data,
+        "count": len(templates_data)
+    })
+
+
+async def _handle_get_remaining_count(
+    client: RegisterUZClient, arguments: Dict[str, Any]
+) -> List[types.TextContent]:
+    entity_type = _ENTITY_TYPE_MAP.get(arguments["entity_type"])
+    if entity_type is None:
+        return format_error_response(ValueError("invalid entity_type"))
+
+    result = await client.get_remaining_count(entity_type)
+
+    return format_success_response({
+        "entity_type": entity_type.value,
+        "remaining_count": result.pocet
+    })
+
+
+async def _handle_get_all_entity_ids(
+    client: RegisterUZClient, arguments: Dict[str, Any]
+) -> List[types.TextContent]:
+    entity_type = _ENTITY_TYPE_MAP.get(arguments["entity_type"])
+    if entity_type is None:
+        return format_error_response(ValueError("invalid entity_type"))
+
+    # This operation might take a while for large datasets
+    ids = await client.get_all_ids(
+        entity_type,
+        arguments.get("changed_from"),
+        arguments.get("max_total")
+    )
+
+    # The ID list can be huge; emit compact metadata and payload as
+    # separate messages instead of one indented dump, which roughly
+    # triples the output size for a long int list
+    return [
+        types.TextContent(
+            type="text",
+            text=orjson.dumps(
+                {"entity_type": entity_type.value, "count": len(ids)}
+            ).decode("utf-8")
+        ),
+        types.TextContent(
+            type="text",
+            text=orjson.dumps(ids).decode("utf-8")
+        ),
+    ]
+
+
+async def _handle_get_entity_suggestions(
+    client: RegisterUZClient, arguments: Dict[str, Any]
+) -> List[types.TextContent]:
+    result = await client.get_entity_suggestions(arguments["query"])
+
+    return format_success_response({
+        "suggestions": result,
+        "count": len(result)
+    })
+
+
+def _make_detail_handler(method_name: str) -> _Handler:
+    """Build a handler for the four detail-by-ID endpoints."""
+    async def handler(
+        client: RegisterUZClient, arguments: Dict[str, Any]
+    ) -> List[types.TextContent]:
+        # The MCP layer may hand a JSON number through as a float; accept
+        # only integral values — truncating 42.7 to 42 would silently
+        # fetch a different record, and True would coerce to record 1
+        item_id = arguments["id"]
+        if isinstance(item_id, bool) or (
+            isinstance(item_id, float) and not item_id.is_integer()
+        ):
+            return format_error_response(ValueError("id must be an integer"))
+        if type(item_id) is not int:
+            try:
+                item_id = int(item_id)
+            except (TypeError, ValueError):
+                return format_error_response(
+                    ValueError("id must be an integer")
+                )
+        if not 0 <= item_id < 10**10:
+            return format_error_response(
+                ValueError("id must be a non-negative integer of at most 10 digits")
+            )
+
+        result = await getattr(client, method_name)(item_id)
+        return format_model(result)
+
+    return handler
+
+
+# O(1) dispatch instead of a linear if/elif ladder over tool names
+_HANDLERS: Dict[str, _Handler] = {
+    "search_accounting_entities": _make_list_handler(
+        AccountingEntitySearchParams,
+        "get_accounting_entities",
+        extra_fields={"ico": "ico", "dic": "dic", "pravna_forma": "legal_form"}
+    ),
+    "get_financial_statements": _make_list_handler(
+        BaseSearchParams, "get_financial_statements"
+    ),
+    "get_financial_reports": _make_list_handler(
+        BaseSearchParams, "get_financial_reports"
+    ),
+    "get_annual_reports": _make_list_handler(
+        BaseSearchParams, "get_annual_reports"
+    ),
+    "get_templates": _handle_get_templates,
+    "get_remaining_count": _handle_get_remaining_count,
+    "get_all_entity_ids": _handle_get_all_entity_ids,
+    "get_entity_suggestions": _handle_get_entity_suggestions,
+    "get_accounting_entity_detail": _make_detail_handler("get_accounting_entity_detail"),
+    "get_financial_statement_detail": _make_detail_handler("get_financial_statement_detail"),
+    "get_financial_report_detail": _make_detail_handler("get_financial_report_detail"),
+    "get_annual_report_detail": _make_detail_handler("get_annual_report_detail"),
+}
+
+# Precompiled argument validators (optional, like uvloop): compiling
+# each tool's inputSchema once turns argument checking into generated
+# bytecode instead of generic schema interpretation per call
+try:
+    import fastjsonschema
+
+    _VALIDATORS: Dict[str, Any] = {
+        tool.name: fastjsonschema.compile(tool.inputSchema) for tool in _TOOLS
+    }
+except ImportError:
+    _VALIDATORS = {}
+
 
 @server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
     """Handle tool calls."""
-    config = get_config()
-    
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        logger.error("%s%s", _UNKNOWN_TOOL_PREFIX, name)
+        return [types.TextContent(type="text", text=_UNKNOWN_TOOL_PREFIX + name)]
+
+    validator = _VALIDATORS.get(name)
+    if validator is not None:
+        try:
+            validator(arguments)
+        except ValueError as e:
+            # fastjsonschema errors derive from ValueError
+            return format_error_response(e)
+
     try:
-        with RegisterUZClient(config) as client:
-            if name == "search_accounting_entities":
-                # Build search parameters
-                params = AccountingEntitySearchParams(
-                    zmenene_od=arguments["changed_from"],
-                    pokracovat_za_id=arguments.get("continue_after_id"),
-                    max_zaznamov=arguments.get("max_records"),
-                    ico=arguments.get("ico"),
-                    dic=arguments.get("dic"),
-                    pravna_forma=arguments.get("legal_form")
-                )
-                
-                # Execute search in thread pool
-                result = await asyncio.to_thread(
-                    client.get_accounting_entities,
-                    params
-                )
-                
-                return format_success_response({
-                    "ids": result.id,
-                    "has_more": result.existujeDalsieId,
-                    "count": len(result.id)
-                })
-            
-            elif name == "get_financial_statements":
-                params = BaseSearchParams(
-                    zmenene_od=arguments["changed_from"],
-                    pokracovat_za_id=arguments.get("continue_after_id"),
-                    max_zaznamov=arguments.get("max_records")
-                )
-                
-                result = await asyncio.to_thread(
-                    client.get_financial_statements,
-                    params
-                )
-                
-                return format_success_response({
-                    "ids": result.id,
-                    "has_more": result.existujeDalsieId,
-                    "count": len(result.id)
-                })
-            
-            elif name == "get_financial_reports":
-                params = BaseSearchParams(
-                    zmenene_od=arguments["changed_from"],
-                    pokracovat_za_id=arguments.get("continue_after_id"),
-                    max_zaznamov=arguments.get("max_records")
-                )
-                
-                result = await asyncio.to_thread(
-                    client.get_financial_reports,
-                    params
-                )
-                
-                return format_success_response({
-                    "ids": result.id,
-                    "has_more": result.existujeDalsieId,
-                    "count": len(result.id)
-                })
-            
-            elif name == "get_annual_reports":
-                params = BaseSearchParams(
-                    zmenene_od=arguments["changed_from"],
-                    pokracovat_za_id=arguments.get("continue_after_id"),
-                    max_zaznamov=arguments.get("max_records")
-                )
-                
-                result = await asyncio.to_thread(
-                    client.get_annual_reports,
-                    params
-                )
-                
-                return format_success_response({
-                    "ids": result.id,
-                    "has_more": result.existujeDalsieId,
-                    "count": len(result.id)
-                })
-            
-            elif name == "get_templates":
-                result = await asyncio.to_thread(client.get_templates)
-                
-                # Format templates for better readability
-                templates_data = []
-                for template in result.sablony:
-                    template_info = {
-                        "id": template.id,
-                    }
-                    if template.nazov:
-                        template_info["name"] = template.nazov
-                    if template.nariadenieMF:
-                        template_info["regulation"] = template.nariadenieMF
-                    if template.tabulky:
-                        template_info["tables_count"] = len(template.tabulky)
-                    templates_data.append(template_info)
-                
-                return format_success_response({
-                    "templates": templates_data,
-                    "count": len(templates_data)
-                })
-            
-            elif name == "get_remaining_count":
-                entity_type = EntityType(arguments["entity_type"])
-                
-                result = await asyncio.to_thread(
-                    client.get_remaining_count,
-                    entity_type
-                )
-                
-                return format_success_response({
-                    "entity_type": entity_type.value,
-                    "remaining_count": result.pocet
-                })
-            
-            elif name == "get_all_entity_ids":
-                entity_type = EntityType(arguments["entity_type"])
-                changed_from = arguments.get("changed_from")
-                max_total = arguments.get("max_total")
-                
-                # This operation might take a while for large datasets
-                ids = await asyncio.to_thread(
-                    client.get_all_ids,
-                    entity_type,
-                    changed_from,
-                    max_total
-                )
-                
-                return format_success_response({
-                    "entity_type": entity_type.value,
-                    "ids": ids,
-                    "count": len(ids)
-                })
-            
-            elif name == "get_entity_suggestions":
-                query = arguments["query"]
-                
-                result = await asyncio.to_thread(
-                    client.get_entity_suggestions,
-                    query
-                )
-                
-                return format_success_response({
-                    "suggestions": result,
-                    "count": len(result)
-                })
-            
-            elif name == "get_accounting_entity_detail":
-                entity_id = arguments["id"]
-                
-                result = await asyncio.to_thread(
-                    client.get_accounting_entity_detail,
-                    entity_id
-                )
-                
-                return format_success_response(result.dict(exclude_none=True))
-            
-            elif name == "get_financial_statement_detail":
-                statement_id = arguments["id"]
-                
-                result = await asyncio.to_thread(
-                    client.get_financial_statement_detail,
-                    statement_id
-                )
-                
-                return format_success_response(result.dict(exclude_none=True))
-            
-            elif name == "get_financial_report_detail":
-                report_id = arguments["id"]
-                
-                result = await asyncio.to_thread(
-                    client.get_financial_report_detail,
-                    report_id
-                )
-                
-                return format_success_response(result.dict(exclude_none=True))
-            
-            elif name == "get_annual_report_detail":
-                report_id = arguments["id"]
-                
-                result = await asyncio.to_thread(
-                    client.get_annual_report_detail,
-                    report_id
-                )
-                
-                return format_success_response(result.dict(exclude_none=True))
-            
-            else:
-                return format_error_response(
-                    ValueError(f"Unknown tool: {name}")
-                )
-    
+        client = await _get_client()
+        return await handler(client, arguments)
     except ValidationError as e:
         return format_error_response(e)
     except RegisterUZError as e:
         return format_error_response(e)
     except Exception as e:
-        logger.exception(f"Unexpected error in tool {name}")
-        return format_error_response(e)
\ No newline at end of file
+        logger.exception("Unexpected error in tool %s", name)
+        return format_error_response(e, log=False)
@@ -1,10 +1,52 @@
 """Type definitions for RegisterUZ API responses and requests."""
 
-from datetime import datetime
+import functools
+import sys
+from array import array
+from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, NamedTuple, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+
+
+def _intern_str(v: Any) -> Any:
+    """Intern low-cardinality code strings so repeated values share one object."""
+    return sys.intern(v) if isinstance(v, str) else v
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_date(v: str) -> Any:
+    """Parse an ISO date string once, deduplicating repeats across records.
+
+    The API occasionally suffixes a time component, so only the date part
+    is read. Unparseable values pass through to pydantic's own validator,
+    which reports them with a proper field error.
+    """
+    try:
+        return date.fromisoformat(v[:10])
+    except ValueError:
+        return v
+
+
+def _coerce_date(v: Any) -> Any:
+    """Route string values through the shared date cache."""
+    return _parse_iso_date(v) if isinstance(v, str) else v
+
+
+def _as_id_array(v: Any) -> Any:
+    """Pack an ID list into a dense signed-64 array (8 bytes per element).
+
+    Lists that don't fit (non-int elements, values outside int64) are
+    passed through unchanged so pydantic reports a proper field error
+    instead of a raw TypeError/OverflowError escaping validation.
+    """
+    if isinstance(v, list):
+        try:
+            return array("q", v)
+        except (TypeError, OverflowError):
+            return v
+    return v
 
 
 class EntityType(str, Enum):
@@ -29,10 +71,9 @@ class LegalForm(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> Optional["LegalForm"]:
         """Convert string to LegalForm enum if possible."""
-        for form in cls:
-            if form.value == value:
-                return form
-        return None
+        # Enum already maintains a value->member map; no need to scan
+        member = cls._value2member_map_.get(value)
+        return member if isinstance(member, LegalForm) else None
 
 
 class BaseSearchParams(BaseModel):
@@ -53,10 +94,32 @@ class BaseSearchParams(BaseModel):
         description="Maximum number of records to return (default 1000, max 10000)"
     )
 
+    # (attribute, query-parameter) pairs, iterated at C speed in
+    # to_query() instead of going through pydantic serialization
+    _QUERY_MAP: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("zmenene_od", "zmenene-od"),
+        ("pokracovat_za_id", "pokracovat-za-id"),
+        ("max_zaznamov", "max-zaznamov"),
+    )
+
+    def to_query(self) -> Dict[str, Any]:
+        """Build the query-parameter dict for this search.
+
+        Walks the fixed _QUERY_MAP rather than model_dump(exclude_none=True),
+        which would run pydantic-core's serializer and build an intermediate
+        dict on every pagination step.
+        """
+        out: Dict[str, Any] = {}
+        for attr, query_name in self._QUERY_MAP:
+            value = getattr(self, attr, None)
+            if value is not None:
+                out[query_name] = value.value if isinstance(value, Enum) else value
+        return out
+
 
 class AccountingEntitySearchParams(BaseSearchParams):
     """Parameters specific to accounting entity search."""
-    
+
     ico: Optional[str] = Field(
         None,
         description="Company identification number (IČO)"
@@ -70,41 +133,75 @@ class AccountingEntitySearchParams(BaseSearchParams):
         description="Legal form code"
     )
 
+    _QUERY_MAP: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        BaseSearchParams._QUERY_MAP + (
+            ("ico", "ico"),
+            ("dic", "dic"),
+            ("pravna_forma", "pravna-forma"),
+        )
+    )
+
 
 class ApiResponse(BaseModel):
     """Standard API response structure."""
     
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     id: List[int] = Field(
         default_factory=list,
         description="List of entity identifiers"
     )
-    existujeDalsieId: bool = Field(
+    existuje_dalsie_id: bool = Field(
         default=False,
+        alias="existujeDalsieId",
         description="Whether more records exist for pagination"
     )
 
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "ApiResponse":
+        """Build from an already-parsed API payload without validation.
+
+        The model is flat, so model_construct is safe; only use with
+        data that came from the API itself.
+        """
+        return cls.model_construct(
+            id=data.get("id") or [],
+            existuje_dalsie_id=bool(data.get("existujeDalsieId", False)),
+        )
+
 
 class RemainingCountResponse(BaseModel):
     """Response for remaining ID count endpoint."""
     
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     pocet: int = Field(
         ...,
         description="Number of remaining IDs"
     )
 
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "RemainingCountResponse":
+        """Build from an already-parsed API payload without validation."""
+        return cls.model_construct(**data)
+
 
 class Template(BaseModel):
     """Report template structure."""
     
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     id: int = Field(..., description="Template ID")
     nazov: Optional[str] = Field(None, description="Template name")
     tabulky: Optional[List[dict]] = Field(None, description="Tables data")
-    nariadenieMF: Optional[str] = Field(None, description="Ministry of Finance regulation")
+    nariadenie_mf: Optional[str] = Field(None, alias="nariadenieMF", description="Ministry of Finance regulation")
 
 
 class TemplatesResponse(BaseModel):
     """Response for templates endpoint."""
     
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     sablony: List[Template] = Field(
         default_factory=list,
         description="List of report templates"
@@ -114,6 +211,8 @@ class TemplatesResponse(BaseModel):
 class Address(BaseModel):
     """Address structure."""
     
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     ulica: Optional[str] = Field(None, description="Street")
     cislo: Optional[str] = Field(None, description="Number")
     psc: Optional[str] = Field(None, description="Postal code")
@@ -123,61 +222,101 @@ class Address(BaseModel):
 class AccountingEntityDetail(BaseModel):
     """Detailed accounting entity information."""
     
+    model_config = ConfigDict(
+        frozen=True, populate_by_name=True, arbitrary_types_allowed=True
+    )
+    
     id: int = Field(..., description="Entity ID")
     ico: Optional[str] = Field(None, description="Company identification number (IČO)")
     dic: Optional[str] = Field(None, description="Tax identification number (DIČ)")
     sid: Optional[str] = Field(None, description="SID")
-    nazovUJ: Optional[str] = Field(None, description="Entity name")
+    nazov_uj: Optional[str] = Field(None, alias="nazovUJ", description="Entity name")
     mesto: Optional[str] = Field(None, description="City")
     ulica: Optional[str] = Field(None, description="Street with number")
     psc: Optional[str] = Field(None, description="Postal code")
-    datumZalozenia: Optional[str] = Field(None, description="Founding date (YYYY-MM-DD)")
-    datumZrusenia: Optional[str] = Field(None, description="Dissolution date (YYYY-MM-DD)")
-    pravnaForma: Optional[str] = Field(None, description="Legal form code")
-    skNace: Optional[str] = Field(None, description="SK NACE classification code")
-    velkostOrganizacie: Optional[str] = Field(None, description="Organization size category code")
-    druhVlastnictva: Optional[str] = Field(None, description="Ownership type code")
+    datum_zalozenia: Optional[date] = Field(None, alias="datumZalozenia", description="Founding date (YYYY-MM-DD)")
+    datum_zrusenia: Optional[date] = Field(None, alias="datumZrusenia", description="Dissolution date (YYYY-MM-DD)")
+    pravna_forma: Optional[str] = Field(None, alias="pravnaForma", description="Legal form code")
+    sk_nace: Optional[str] = Field(None, alias="skNace", description="SK NACE classification code")
+    velkost_organizacie: Optional[str] = Field(None, alias="velkostOrganizacie", description="Organization size category code")
+    druh_vlastnictva: Optional[str] = Field(None, alias="druhVlastnictva", description="Ownership type code")
     kraj: Optional[str] = Field(None, description="Region code")
     okres: Optional[str] = Field(None, description="District code")
     sidlo: Optional[str] = Field(None, description="Municipality code")
     konsolidovana: Optional[bool] = Field(None, description="Has consolidated financial statements")
-    idUctovnychZavierok: Optional[List[int]] = Field(None, description="List of financial statement IDs")
-    idVyrocnychSprav: Optional[List[int]] = Field(None, description="List of annual report IDs")
-    zdrojDat: Optional[str] = Field(None, description="Data source")
-    datumPoslednejUpravy: Optional[str] = Field(None, description="Last update date (YYYY-MM-DD)")
+    id_uctovnych_zavierok: Optional[array] = Field(None, alias="idUctovnychZavierok", description="List of financial statement IDs")
+    id_vyrocnych_sprav: Optional[array] = Field(None, alias="idVyrocnychSprav", description="List of annual report IDs")
+    zdroj_dat: Optional[str] = Field(None, alias="zdrojDat", description="Data source")
+    datum_poslednej_upravy: Optional[date] = Field(None, alias="datumPoslednejUpravy", description="Last update date (YYYY-MM-DD)")
+
+    _intern_codes = field_validator(
+        "pravna_forma", "sk_nace", "velkost_organizacie", "druh_vlastnictva",
+        "kraj", "okres", "sidlo", "zdroj_dat", mode="before"
+    )(_intern_str)
+    _parse_dates = field_validator(
+        "datum_zalozenia", "datum_zrusenia", "datum_poslednej_upravy",
+        mode="before"
+    )(_coerce_date)
+    _pack_ids = field_validator(
+        "id_uctovnych_zavierok", "id_vyrocnych_sprav", mode="before"
+    )(_as_id_array)
+
+    @field_serializer("id_uctovnych_zavierok", "id_vyrocnych_sprav")
+    def _ids_as_list(self, v: Optional[array]) -> Optional[List[int]]:
+        """Unpack to a plain list on dump; arrays are not JSON-serializable."""
+        return v.tolist() if v is not None else None
 
 
 class FinancialStatementDetail(BaseModel):
     """Detailed financial statement information."""
     
+    model_config = ConfigDict(
+        frozen=True, populate_by_name=True, arbitrary_types_allowed=True
+    )
+    
     id: int = Field(..., description="Statement ID")
-    obdobieOd: Optional[str] = Field(None, description="Period from (YYYY-MM)")
-    obdobieDo: Optional[str] = Field(None, description="Period to (YYYY-MM)")
-    datumPodania: Optional[str] = Field(None, description="Submission date (YYYY-MM-DD)")
-    datumZostavenia: Optional[str] = Field(None, description="Compilation date (YYYY-MM-DD)")
-    datumSchvalenia: Optional[str] = Field(None, description="Approval date (YYYY-MM-DD)")
-    datumZostaveniaK: Optional[str] = Field(None, description="Compiled as of date (YYYY-MM-DD)")
-    datumPrilozeniaSpravyAuditora: Optional[str] = Field(None, description="Auditor report attachment date (YYYY-MM-DD)")
-    nazovFondu: Optional[str] = Field(None, description="Fund name")
-    leiKod: Optional[str] = Field(None, description="LEI code")
-    idUJ: Optional[int] = Field(None, description="Accounting entity ID")
+    obdobie_od: Optional[str] = Field(None, alias="obdobieOd", description="Period from (YYYY-MM)")
+    obdobie_do: Optional[str] = Field(None, alias="obdobieDo", description="Period to (YYYY-MM)")
+    datum_podania: Optional[date] = Field(None, alias="datumPodania", description="Submission date (YYYY-MM-DD)")
+    datum_zostavenia: Optional[date] = Field(None, alias="datumZostavenia", description="Compilation date (YYYY-MM-DD)")
+    datum_schvalenia: Optional[date] = Field(None, alias="datumSchvalenia", description="Approval date (YYYY-MM-DD)")
+    datum_zostavenia_k: Optional[date] = Field(None, alias="datumZostaveniaK", description="Compiled as of date (YYYY-MM-DD)")
+    datum_prilozenia_spravy_auditora: Optional[date] = Field(None, alias="datumPrilozeniaSpravyAuditora", description="Auditor report attachment date (YYYY-MM-DD)")
+    nazov_fondu: Optional[str] = Field(None, alias="nazovFondu", description="Fund name")
+    lei_kod: Optional[str] = Field(None, alias="leiKod", description="LEI code")
+    id_uj: Optional[int] = Field(None, alias="idUJ", description="Accounting entity ID")
     konsolidovana: Optional[bool] = Field(None, description="Is consolidated")
-    konsolidovanaZavierkaUstrednejStatnejSpravy: Optional[bool] = Field(None, description="Is central government consolidated")
-    suhrnnaUctovnaZavierkaVerejnejSpravy: Optional[bool] = Field(None, description="Is public administration summary")
+    konsolidovana_zavierka_ustrednej_statnej_spravy: Optional[bool] = Field(None, alias="konsolidovanaZavierkaUstrednejStatnejSpravy", description="Is central government consolidated")
+    suhrnna_uctovna_zavierka_verejnej_spravy: Optional[bool] = Field(None, alias="suhrnnaUctovnaZavierkaVerejnejSpravy", description="Is public administration summary")
     typ: Optional[str] = Field(None, description="Type (Riadna/Mimoriadna/Priebežná/Kombinovaná)")
-    idUctovnychVykazov: Optional[List[int]] = Field(None, description="List of financial report IDs")
-    zdrojDat: Optional[str] = Field(None, description="Data source")
-    datumPoslednejUpravy: Optional[str] = Field(None, description="Last update date (YYYY-MM-DD)")
+    id_uctovnych_vykazov: Optional[array] = Field(None, alias="idUctovnychVykazov", description="List of financial report IDs")
+    zdroj_dat: Optional[str] = Field(None, alias="zdrojDat", description="Data source")
+    datum_poslednej_upravy: Optional[date] = Field(None, alias="datumPoslednejUpravy", description="Last update date (YYYY-MM-DD)")
+
+    _intern_codes = field_validator("typ", "zdroj_dat", mode="before")(_intern_str)
+    _parse_dates = field_validator(
+        "datum_podania", "datum_zostavenia", "datum_schvalenia",
+        "datum_zostavenia_k", "datum_prilozenia_spravy_auditora",
+        "datum_poslednej_upravy", mode="before"
+    )(_coerce_date)
+    _pack_ids = field_validator("id_uctovnych_vykazov", mode="before")(_as_id_array)
+
+    @field_serializer("id_uctovnych_vykazov")
+    def _ids_as_list(self, v: Optional[array]) -> Optional[List[int]]:
+        """Unpack to a plain list on dump; arrays are not JSON-serializable."""
+        return v.tolist() if v is not None else None
 
 
 class Attachment(BaseModel):
     """Attachment information."""
     
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     id: int = Field(..., description="Attachment ID")
     meno: Optional[str] = Field(None, description="File name")
-    mimeType: Optional[str] = Field(None, description="MIME type")
-    velkostPrilohy: Optional[int] = Field(None, description="File size")
-    pocetStran: Optional[int] = Field(None, description="Page count")
+    mime_type: Optional[str] = Field(None, alias="mimeType", description="MIME type")
+    velkost_prilohy: Optional[int] = Field(None, alias="velkostPrilohy", description="File size")
+    pocet_stran: Optional[int] = Field(None, alias="pocetStran", description="Page count")
     digest: Optional[str] = Field(None, description="SHA-256 hash")
     jazyk: Optional[str] = Field(None, description="Language")
 
@@ -185,86 +324,156 @@ class Attachment(BaseModel):
 class TitlePage(BaseModel):
     """Title page of financial report."""
     
-    nazovUctovnejJednotky: Optional[str] = Field(None, description="Entity name")
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
+    nazov_uctovnej_jednotky: Optional[str] = Field(None, alias="nazovUctovnejJednotky", description="Entity name")
     ico: Optional[str] = Field(None, description="IČO")
     dic: Optional[str] = Field(None, description="DIČ")
     sid: Optional[str] = Field(None, description="SID")
     adresa: Optional[Address] = Field(None, description="Address")
-    miestoPodnikania: Optional[Address] = Field(None, description="Business location")
-    pravnaForma: Optional[str] = Field(None, description="Legal form code")
-    skNace: Optional[str] = Field(None, description="SK NACE code")
-    typZavierky: Optional[str] = Field(None, description="Statement type")
+    miesto_podnikania: Optional[Address] = Field(None, alias="miestoPodnikania", description="Business location")
+    pravna_forma: Optional[str] = Field(None, alias="pravnaForma", description="Legal form code")
+    sk_nace: Optional[str] = Field(None, alias="skNace", description="SK NACE code")
+    typ_zavierky: Optional[str] = Field(None, alias="typZavierky", description="Statement type")
     konsolidovana: Optional[bool] = Field(None, description="Is consolidated")
-    konsolidovanaZavierkaUstrednejStatnejSpravy: Optional[bool] = Field(None, description="Is central government consolidated")
-    suhrnnaUctovnaZavierkaVerejnejSpravy: Optional[bool] = Field(None, description="Is public administration summary")
-    typUctovnejJednotky: Optional[str] = Field(None, description="Entity type (malá/veľká)")
-    oznacenieObchodnehoRegistra: Optional[str] = Field(None, description="Commercial register designation")
-    nazovSpravcovskehoFondu: Optional[str] = Field(None, description="Management company/fund name")
-    leiKod: Optional[str] = Field(None, description="LEI code")
-    obdobieOd: Optional[str] = Field(None, description="Period from (YYYY-MM)")
-    obdobieDo: Optional[str] = Field(None, description="Period to (YYYY-MM)")
-    predchadzajuceObdobieOd: Optional[str] = Field(None, description="Previous period from (YYYY-MM)")
-    predchadzajuceObdobieDo: Optional[str] = Field(None, description="Previous period to (YYYY-MM)")
-    datumVyplnenia: Optional[str] = Field(None, description="Fill date (YYYY-MM-DD)")
-    datumSchvalenia: Optional[str] = Field(None, description="Approval date (YYYY-MM-DD)")
-    datumZostavenia: Optional[str] = Field(None, description="Compilation date (YYYY-MM-DD)")
-    datumZostaveniaK: Optional[str] = Field(None, description="Compiled as of date (YYYY-MM-DD)")
-    datumPrilozeniaSpravyAuditora: Optional[str] = Field(None, description="Auditor report attachment date (YYYY-MM-DD)")
+    konsolidovana_zavierka_ustrednej_statnej_spravy: Optional[bool] = Field(None, alias="konsolidovanaZavierkaUstrednejStatnejSpravy", description="Is central government consolidated")
+    suhrnna_uctovna_zavierka_verejnej_spravy: Optional[bool] = Field(None, alias="suhrnnaUctovnaZavierkaVerejnejSpravy", description="Is public administration summary")
+    typ_uctovnej_jednotky: Optional[str] = Field(None, alias="typUctovnejJednotky", description="Entity type (malá/veľká)")
+    oznacenie_obchodneho_registra: Optional[str] = Field(None, alias="oznacenieObchodnehoRegistra", description="Commercial register designation")
+    nazov_spravcovskeho_fondu: Optional[str] = Field(None, alias="nazovSpravcovskehoFondu", description="Management company/fund name")
+    lei_kod: Optional[str] = Field(None, alias="leiKod", description="LEI code")
+    obdobie_od: Optional[str] = Field(None, alias="obdobieOd", description="Period from (YYYY-MM)")
+    obdobie_do: Optional[str] = Field(None, alias="obdobieDo", description="Period to (YYYY-MM)")
+    predchadzajuce_obdobie_od: Optional[str] = Field(None, alias="predchadzajuceObdobieOd", description="Previous period from (YYYY-MM)")
+    predchadzajuce_obdobie_do: Optional[str] = Field(None, alias="predchadzajuceObdobieDo", description="Previous period to (YYYY-MM)")
+    datum_vyplnenia: Optional[date] = Field(None, alias="datumVyplnenia", description="Fill date (YYYY-MM-DD)")
+    datum_schvalenia: Optional[date] = Field(None, alias="datumSchvalenia", description="Approval date (YYYY-MM-DD)")
+    datum_zostavenia: Optional[date] = Field(None, alias="datumZostavenia", description="Compilation date (YYYY-MM-DD)")
+    datum_zostavenia_k: Optional[date] = Field(None, alias="datumZostaveniaK", description="Compiled as of date (YYYY-MM-DD)")
+    datum_prilozenia_spravy_auditora: Optional[date] = Field(None, alias="datumPrilozeniaSpravyAuditora", description="Auditor report attachment date (YYYY-MM-DD)")
+
+    _parse_dates = field_validator(
+        "datum_vyplnenia", "datum_schvalenia", "datum_zostavenia",
+        "datum_zostavenia_k", "datum_prilozenia_spravy_auditora",
+        mode="before"
+    )(_coerce_date)
+
+
+class LocalizedName(NamedTuple):
+    """Compact localized label; the API always sends the sk/en pair."""
+
+    sk: str = ""
+    en: str = ""
 
 
 class Table(BaseModel):
     """Financial report table."""
     
-    nazov: Optional[Dict[str, str]] = Field(None, description="Table name (localized)")
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
+    nazov: Optional[LocalizedName] = Field(None, description="Table name (localized)")
     data: Optional[List[str]] = Field(None, description="Table data")
 
+    @field_validator("nazov", mode="before")
+    @classmethod
+    def _compact_nazov(cls, v: Any) -> Any:
+        """Fold the per-row locale dict into an interned tuple.
+
+        Reports carry thousands of table rows; a two-slot tuple with
+        interned values is far smaller than a dict per row.
+        """
+        if isinstance(v, dict):
+            # `or ""` also covers explicit null locale values, which would
+            # otherwise escape as a raw TypeError from intern()
+            return LocalizedName(
+                sk=sys.intern(v.get("sk") or ""),
+                en=sys.intern(v.get("en") or ""),
+            )
+        return v
+
+    @field_serializer("nazov")
+    def _nazov_as_dict(self, v: Optional[LocalizedName]) -> Optional[Dict[str, str]]:
+        """Keep the wire shape: serialize back to the locale dict."""
+        if v is None:
+            return None
+        return {"sk": v.sk, "en": v.en}
+
 
 class ReportContent(BaseModel):
     """Financial report content."""
     
-    titulnaStrana: Optional[TitlePage] = Field(None, description="Title page")
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
+    titulna_strana: Optional[TitlePage] = Field(None, alias="titulnaStrana", description="Title page")
     tabulky: Optional[List[Table]] = Field(None, description="Tables")
 
 
 class FinancialReportDetail(BaseModel):
     """Detailed financial report information."""
     
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     id: int = Field(..., description="Report ID")
-    idUctovnejZavierky: Optional[int] = Field(None, description="Financial statement ID")
-    idVyrocnejSpravy: Optional[int] = Field(None, description="Annual report ID")
-    idSablony: Optional[int] = Field(None, description="Template ID")
+    id_uctovnej_zavierky: Optional[int] = Field(None, alias="idUctovnejZavierky", description="Financial statement ID")
+    id_vyrocnej_spravy: Optional[int] = Field(None, alias="idVyrocnejSpravy", description="Annual report ID")
+    id_sablony: Optional[int] = Field(None, alias="idSablony", description="Template ID")
     mena: Optional[str] = Field(None, description="Currency")
-    kodDanovehoUradu: Optional[str] = Field(None, description="Tax office code")
-    pristupnostDat: Optional[str] = Field(None, description="Data accessibility (Verejné/Verejné prílohy/Neverejné)")
+    kod_danoveho_uradu: Optional[str] = Field(None, alias="kodDanovehoUradu", description="Tax office code")
+    pristupnost_dat: Optional[str] = Field(None, alias="pristupnostDat", description="Data accessibility (Verejné/Verejné prílohy/Neverejné)")
     prilohy: Optional[List[Attachment]] = Field(None, description="Attachments")
     obsah: Optional[ReportContent] = Field(None, description="Report content")
-    zdrojDat: Optional[str] = Field(None, description="Data source")
-    datumPoslednejUpravy: Optional[str] = Field(None, description="Last update date (YYYY-MM-DD)")
+    zdroj_dat: Optional[str] = Field(None, alias="zdrojDat", description="Data source")
+    datum_poslednej_upravy: Optional[date] = Field(None, alias="datumPoslednejUpravy", description="Last update date (YYYY-MM-DD)")
+
+    _intern_codes = field_validator(
+        "mena", "kod_danoveho_uradu", "pristupnost_dat", "zdroj_dat", mode="before"
+    )(_intern_str)
+    _parse_dates = field_validator("datum_poslednej_upravy", mode="before")(_coerce_date)
 
 
 class AnnualReportDetail(BaseModel):
     """Detailed annual report information."""
     
+    model_config = ConfigDict(
+        frozen=True, populate_by_name=True, arbitrary_types_allowed=True
+    )
+    
     id: int = Field(..., description="Report ID")
-    nazovUJ: Optional[str] = Field(None, description="Entity name at submission time")
+    nazov_uj: Optional[str] = Field(None, alias="nazovUJ", description="Entity name at submission time")
     typ: Optional[str] = Field(None, description="Report type")
-    nazovFondu: Optional[str] = Field(None, description="Fund name")
-    leiKod: Optional[str] = Field(None, description="LEI code")
-    obdobieOd: Optional[str] = Field(None, description="Period from (YYYY-MM)")
-    obdobieDo: Optional[str] = Field(None, description="Period to (YYYY-MM)")
-    datumPodania: Optional[str] = Field(None, description="Submission date (YYYY-MM-DD)")
-    datumZostaveniaK: Optional[str] = Field(None, description="Compiled as of date (YYYY-MM-DD)")
-    pristupnostDat: Optional[str] = Field(None, description="Data accessibility (Verejné/Neverejné)")
+    nazov_fondu: Optional[str] = Field(None, alias="nazovFondu", description="Fund name")
+    lei_kod: Optional[str] = Field(None, alias="leiKod", description="LEI code")
+    obdobie_od: Optional[str] = Field(None, alias="obdobieOd", description="Period from (YYYY-MM)")
+    obdobie_do: Optional[str] = Field(None, alias="obdobieDo", description="Period to (YYYY-MM)")
+    datum_podania: Optional[date] = Field(None, alias="datumPodania", description="Submission date (YYYY-MM-DD)")
+    datum_zostavenia_k: Optional[date] = Field(None, alias="datumZostaveniaK", description="Compiled as of date (YYYY-MM-DD)")
+    pristupnost_dat: Optional[str] = Field(None, alias="pristupnostDat", description="Data accessibility (Verejné/Neverejné)")
     prilohy: Optional[List[Attachment]] = Field(None, description="Attachments")
-    idUctovnychVykazov: Optional[List[int]] = Field(None, description="List of financial report IDs")
-    idUJ: Optional[int] = Field(None, description="Accounting entity ID")
-    zdrojDat: Optional[str] = Field(None, description="Data source")
-    datumPoslednejUpravy: Optional[str] = Field(None, description="Last update date (YYYY-MM-DD)")
+    id_uctovnych_vykazov: Optional[array] = Field(None, alias="idUctovnychVykazov", description="List of financial report IDs")
+    id_uj: Optional[int] = Field(None, alias="idUJ", description="Accounting entity ID")
+    zdroj_dat: Optional[str] = Field(None, alias="zdrojDat", description="Data source")
+    datum_poslednej_upravy: Optional[date] = Field(None, alias="datumPoslednejUpravy", description="Last update date (YYYY-MM-DD)")
+
+    _intern_codes = field_validator(
+        "typ", "pristupnost_dat", "zdroj_dat", mode="before"
+    )(_intern_str)
+    _parse_dates = field_validator(
+        "datum_podania", "datum_zostavenia_k", "datum_poslednej_upravy",
+        mode="before"
+    )(_coerce_date)
+    _pack_ids = field_validator("id_uctovnych_vykazov", mode="before")(_as_id_array)
+
+    @field_serializer("id_uctovnych_vykazov")
+    def _ids_as_list(self, v: Optional[array]) -> Optional[List[int]]:
+        """Unpack to a plain list on dump; arrays are not JSON-serializable."""
+        return v.tolist() if v is not None else None
 
 
 class AccountingEntity(BaseModel):
     """Accounting entity details."""
     
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     id: int = Field(..., description="Entity ID")
     ico: Optional[str] = Field(None, description="Company identification number")
     dic: Optional[str] = Field(None, description="Tax identification number")
@@ -282,6 +491,8 @@ class AccountingEntity(BaseModel):
 class FinancialStatement(BaseModel):
     """Financial statement details."""
     
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     id: int = Field(..., description="Statement ID")
     uctovna_jednotka_id: int = Field(..., description="Accounting entity ID")
     obdobie_od: str = Field(..., description="Period from")
@@ -294,6 +505,8 @@ class FinancialStatement(BaseModel):
 class FinancialReport(BaseModel):
     """Financial report details."""
     
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     id: int = Field(..., description="Report ID")
     uctovna_zavierka_id: int = Field(..., description="Financial statement ID")
     typ_vykazu: str = Field(..., description="Report type")
@@ -304,6 +517,8 @@ class FinancialReport(BaseModel):
 class AnnualReport(BaseModel):
     """Annual report details."""
     
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     id: int = Field(..., description="Report ID")
     uctovna_jednotka_id: int = Field(..., description="Accounting entity ID")
     rok: int = Field(..., description="Year")
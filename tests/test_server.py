@@ -5,10 +5,18 @@ import pytest
 from unittest.mock import AsyncMock, Mock, patch
 
 from mcp import types
+from mcp_server_registeruz import server as server_module
 from mcp_server_registeruz.server import server, call_tool, list_tools
 from mcp_server_registeruz.types import ApiResponse, TemplatesResponse, Template
 
 
+@pytest.fixture(autouse=True)
+async def _fresh_client():
+    """Drop the shared client between tests so mocks don't leak."""
+    yield
+    await server_module.close_client()
+
+
 class TestMCPServer:
     """Test MCP server functionality."""
     
@@ -17,9 +25,9 @@ class TestMCPServer:
         """Test that all tools are listed correctly."""
         tools = await list_tools()
         
-        assert len(tools) == 7
+        assert len(tools) == 12
         tool_names = [tool.name for tool in tools]
-        
+
         expected_tools = [
             "search_accounting_entities",
             "get_financial_statements",
@@ -27,7 +35,12 @@ class TestMCPServer:
             "get_annual_reports",
             "get_templates",
             "get_remaining_count",
-            "get_all_entity_ids"
+            "get_all_entity_ids",
+            "get_entity_suggestions",
+            "get_accounting_entity_detail",
+            "get_financial_statement_detail",
+            "get_financial_report_detail",
+            "get_annual_report_detail"
         ]
         
         for expected in expected_tools:
@@ -55,8 +68,8 @@ class TestMCPServer:
         mock_config = Mock()
         mock_get_config.return_value = mock_config
         
-        mock_client = Mock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
         
         mock_response = ApiResponse(id=[1, 2, 3], existujeDalsieId=True)
         mock_client.get_accounting_entities.return_value = mock_response
@@ -88,8 +101,8 @@ class TestMCPServer:
         mock_config = Mock()
         mock_get_config.return_value = mock_config
         
-        mock_client = Mock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
         
         template = Template(
             id=1,
@@ -123,8 +136,8 @@ class TestMCPServer:
         mock_config = Mock()
         mock_get_config.return_value = mock_config
         
-        mock_client = Mock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
         
         # Simulate an error
         mock_client.get_financial_statements.side_effect = Exception("Test error")
@@ -138,6 +151,34 @@ class TestMCPServer:
         assert result[0].type == "text"
         assert "Error: Exception: Test error" in result[0].text
     
+    @pytest.mark.asyncio
+    @patch('mcp_server_registeruz.server.RegisterUZClient')
+    @patch('mcp_server_registeruz.server.get_config')
+    async def test_call_tool_api_error_includes_status(self, mock_get_config, mock_client_class):
+        """Test that API errors carry the upstream status code."""
+        from mcp_server_registeruz.client import RegisterUZAPIError
+
+        # Setup mocks
+        mock_config = Mock()
+        mock_get_config.return_value = mock_config
+
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+
+        # Simulate an upstream HTTP failure
+        mock_client.get_financial_statements.side_effect = RegisterUZAPIError(
+            "API request failed", status_code=500
+        )
+
+        # Call tool
+        arguments = {"changed_from": "2024-01-01"}
+        result = await call_tool("get_financial_statements", arguments)
+
+        # Verify error response
+        assert len(result) == 1
+        assert result[0].type == "text"
+        assert "Error: RegisterUZAPIError: API request failed (status 500)" in result[0].text
+
     @pytest.mark.asyncio
     async def test_call_tool_unknown_tool(self):
         """Test calling an unknown tool."""
@@ -158,8 +199,8 @@ class TestMCPServer:
         mock_config = Mock()
         mock_get_config.return_value = mock_config
         
-        mock_client = Mock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
         
         # Simulate validation error
         mock_client.get_accounting_entities.side_effect = ValidationError.from_exception_data(